@@ -1,12 +1,432 @@
+import gzip
+import hashlib
+import os
+import re
 import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.offline import get_plotlyjs, get_plotlyjs_version
 from plotly.subplots import make_subplots
+import numpy as np
 import pandas as pd
+from datetime import datetime
+import pytz
+
+# Serialize figures with orjson (native NumPy support) in to_html/to_json;
+# without it plotly keeps its built-in json encoder
+try:
+    import orjson  # noqa: F401
+except ImportError:
+    pass
+else:
+    pio.json.config.default_engine = 'orjson'
+
+# plotly base64-encodes every NumPy array into the figure JSON ("bdata");
+# pybase64's SIMD encoder is a drop-in for the stdlib module it looks up
+try:
+    import pybase64
+except ImportError:
+    pass
+else:
+    import _plotly_utils.utils
+    _plotly_utils.utils.base64 = pybase64
+
+# Candles beyond this count are merged into coarser OHLC buckets before export
+MAX_CANDLES = 2000
+
+# Versioned plotly.js bundles written by _plotlyjs_bundle (plotly-<x.y.z>.min.js)
+PLOTLYJS_BUNDLE_RE = re.compile(r'plotly-\d+\.\d+\.\d+\.min\.js')
+
+# Hover templates shared by every chart that draws these traces
+BID_HOVER = '<b>Bid</b><br>Price: $%{x:.2f}<br>Cumulative: %{y:.2f}<extra></extra>'
+ASK_HOVER = '<b>Ask</b><br>Price: $%{x:.2f}<br>Cumulative: %{y:.2f}<extra></extra>'
+AGGRESSIVE_BUY_HOVER = '<b>Aggressive Buy</b><br>Price: %{y:.2f}<extra></extra>'
+AGGRESSIVE_SELL_HOVER = '<b>Aggressive Sell</b><br>Price: %{y:.2f}<extra></extra>'
+
+# Combined dashboard layout that does not change between refreshes.
+# Axes: xaxis/yaxis = top panel, xaxis2/yaxis2 = order book depth.
+AXIS_GRID = {'showgrid': True, 'gridwidth': 1, 'gridcolor': 'rgba(128, 128, 128, 0.2)'}
+DASHBOARD_LAYOUT = {
+    'title': {'x': 0.5, 'xanchor': 'center', 'font': {'size': 16}},
+    'hovermode': 'x unified',  # Mum + SMA/EMA degerleri tek tooltip'te
+    'spikedistance': 0,  # no spike line lookups on mouse move (hides the unified spike line)
+    'template': 'plotly_dark',
+    'autosize': True,
+    'height': None,
+    'showlegend': True,
+    'dragmode': False,  # Plotly drag KAPALI - native kullan
+    'legend': {
+        'orientation': 'h',
+        'yanchor': 'bottom',
+        'y': 1.01,
+        'xanchor': 'center',
+        'x': 0.5,
+        'font': {'size': 9}
+    },
+    'margin': {'l': 30, 'r': 10, 't': 60, 'b': 30},
+    'font': {'size': 10},
+    'hoverlabel': {'font': {'size': 10}},
+    'xaxis': {'title': {'text': 'Time'}, 'rangeslider': {'visible': False}, **AXIS_GRID},
+    'yaxis': {'title': {'text': 'Price'}, **AXIS_GRID},
+    'xaxis2': {'title': {'text': 'Price (USD)'}, **AXIS_GRID},
+    'yaxis2': {'title': {'text': 'Cumulative Volume'}, **AXIS_GRID}
+}
+
+# INTERACTIVE CHART - Zoom ve pan aktif. to_html only reads this
+# ('responsive' is already set, so its setdefault is a no-op).
+DASHBOARD_CONFIG = {
+    'displayModeBar': True,
+    'displaylogo': False,
+    'scrollZoom': True,  # Mouse wheel zoom AÇIK
+    'doubleClick': 'reset',  # Çift tık sıfırlar
+    'responsive': True,
+    'staticPlot': False,
+    'editable': False,
+    'showTips': True,
+    'modeBarButtonsToRemove': ('lasso2d', 'select2d', 'autoScale2d', 'toggleSpikelines'),
+}
+
+# Order book overlay text, filled from the orderbook_stats dict
+ORDERBOOK_STATS_TEMPLATE = (
+    "<b>Order Book (Live)</b><br>"
+    "Spread: ${spread:.2f} ({spread_pct:.3f}%)<br>"
+    "Bid Vol: {bid_volume:.2f}<br>"
+    "Ask Vol: {ask_volume:.2f}<br>"
+    "Ratio: {volume_ratio:.2f}<br>"
+    "<b>Imbalance: {imbalance}</b>"
+)
 
 
 class AltcoinRatioVisualizer:
-    def __init__(self):
-        """Visualizer for Altcoin Ratio analysis."""
-        pass
+    def __init__(self, max_candles=MAX_CANDLES, gzip_output=False):
+        """
+        Visualizer for Altcoin Ratio analysis.
+
+        Args:
+            max_candles: Candle/line point budget per trace (None disables downsampling)
+            gzip_output: Also write a precompressed <output_file>.gz next to each chart
+        """
+        self.max_candles = max_candles
+        self.gzip_output = gzip_output
+        self._html_shells = {}
+        # Digest of the page last written to each output file
+        self._last_digest = {}
+        # Combined chart base (subplots + BTC candles + levels) from the last refresh
+        self._base_cache = {'level_key': None, 'fig': None}
+
+    def _downsample_ohlc(self, df, columns=('open', 'high', 'low', 'close')):
+        """
+        Merge consecutive candles so at most max_candles rows reach the browser.
+
+        Each bucket keeps the first open, highest high, lowest low and last
+        close, so the candle envelope is preserved at the coarser resolution.
+
+        Args:
+            df: DataFrame with datetime and OHLC columns
+            columns: Names of the open, high, low, close columns
+        """
+        if not self.max_candles or len(df) <= self.max_candles:
+            return df
+
+        open_col, high_col, low_col, close_col = columns
+        factor = -(-len(df) // self.max_candles)  # ceil division
+        buckets = pd.RangeIndex(len(df)) // factor
+
+        return df.groupby(buckets).agg({
+            'datetime': 'first',
+            open_col: 'first',
+            high_col: 'max',
+            low_col: 'min',
+            close_col: 'last'
+        })
+
+    def _downsample_line(self, times, values):
+        """
+        Reduce a line trace to about max_candles points with min-max decimation.
+
+        The series is split into max_candles / 2 equal buckets and each keeps
+        its lowest and highest point, so peaks and troughs survive. Leading
+        NaNs (indicator warm-up) are dropped first; they are not drawn anyway.
+        Interior NaN gaps keep one NaN per bucket so the line still breaks there.
+
+        Returns:
+            Tuple of (times, values) arrays
+        """
+        if not self.max_candles or len(values) <= self.max_candles:
+            return times, values
+
+        is_nan = np.isnan(values)
+        if is_nan.all():
+            return times[:0], values[:0]
+        start = int(np.argmax(~is_nan))
+        y = values[start:]
+        bucket_size = -(-2 * len(y) // self.max_candles)  # ceil division
+        n_buckets = -(-len(y) // bucket_size)
+
+        # Pad the last bucket with NaN so the series reshapes to (buckets, size);
+        # NaNs are masked to +/-inf so they never win the min/max
+        padded = np.full(n_buckets * bucket_size, np.nan, dtype=np.float64)
+        padded[:len(y)] = y
+        padded = padded.reshape(n_buckets, bucket_size)
+        nan_mask = np.isnan(padded)
+        has_values = ~nan_mask.all(axis=1)
+
+        offsets = np.arange(n_buckets) * bucket_size
+        lows = offsets + np.argmin(np.where(nan_mask, np.inf, padded), axis=1)
+        highs = offsets + np.argmax(np.where(nan_mask, -np.inf, padded), axis=1)
+
+        gaps = np.flatnonzero(is_nan[start:])
+        gaps = gaps[np.unique(gaps // bucket_size, return_index=True)[1]]
+
+        picks = np.concatenate((lows[has_values], highs[has_values], gaps))
+        keep = start + np.unique(picks)
+        return times[keep], values[keep]
+
+    def _rows_from(self, df, start):
+        """
+        Drop the rows of an ascending datetime-sorted DataFrame that fall
+        before start (candle frames; not footprint_df, which is newest-first).
+
+        The cut is found with a binary search on the datetime column, so
+        nothing outside the visible window is copied or masked row by row.
+        """
+        if df is None or len(df) == 0:
+            return df
+        return df.iloc[df['datetime'].searchsorted(start):]
+
+    def _ohlc_arrays(self, df, columns=('open', 'high', 'low', 'close')):
+        """
+        Return df's OHLC columns as float32 arrays keyed open/high/low/close,
+        ready to pass to go.Candlestick(**...) or trace.update(**...).
+        """
+        return {key: df[column].to_numpy(dtype=np.float32)
+                for key, column in zip(('open', 'high', 'low', 'close'), columns)}
+
+    def _chart_arrays(self, btc_df, ratio_df):
+        """
+        Downsample and extract everything the ratio and combined charts plot.
+
+        Returns:
+            Dict with btc_times/btc_ohlc and candle_times/ratio_ohlc for the
+            candle traces, sma50/ema21/sma20 as {'x', 'y'} line data and
+            x_range (first, last ratio time) for the level lines
+        """
+        btc_candles = self._downsample_ohlc(btc_df)
+        ratio_candles = self._downsample_ohlc(
+            ratio_df, ('ar_open', 'ar_high', 'ar_low', 'ar_close'))
+
+        # Extract plotted columns once; every trace reuses the same arrays.
+        # float32 is ample for chart precision and halves the serialized size.
+        # Long indicator lines are thinned like the candles are bucketed.
+        times = self._local_times(ratio_df['datetime'])
+        lines = {}
+        for column in ('sma50', 'ema21', 'sma20'):
+            line_times, values = self._downsample_line(
+                times, ratio_df[column].to_numpy(dtype=np.float32))
+            lines[column] = {'x': line_times, 'y': values}
+
+        # BTC and ratio candles normally sit on the same timestamps (the ratio
+        # is derived from the overlay frame); hold a single time array then
+        candle_times = (times if ratio_candles is ratio_df
+                        else self._local_times(ratio_candles['datetime']))
+        btc_times = (candle_times if self._same_times(btc_candles, ratio_candles)
+                     else self._local_times(btc_candles['datetime']))
+
+        return {
+            'btc_times': btc_times,
+            'btc_ohlc': self._ohlc_arrays(btc_candles),
+            'candle_times': candle_times,
+            'ratio_ohlc': self._ohlc_arrays(
+                ratio_candles, ('ar_open', 'ar_high', 'ar_low', 'ar_close')),
+            'x_range': (times[0], times[-1]),
+            **lines
+        }
+
+    def _local_times(self, datetimes):
+        """
+        Return a datetime column as a datetime64 array of wall-clock times.
+
+        plotly serializes tz-aware Series as local wall-clock strings; a plain
+        to_numpy() would give an object array of Timestamps instead, which is
+        slow to serialize and carries a UTC offset plotly.js does not expect.
+        """
+        if datetimes.dt.tz is not None:
+            datetimes = datetimes.dt.tz_localize(None)
+        return datetimes.to_numpy()
+
+    def _html_shell(self, fig, output_file, config):
+        """
+        Return the cached (head, tail) of the HTML page around the figure JSON.
+
+        The page shell only depends on the plotly.js bundle, the config and
+        the div size, so it is rendered once from an empty figure and split
+        where plotly puts the data/layout arguments of Plotly.newPlot.
+        """
+        include_plotlyjs = self._plotlyjs_bundle(output_file)
+        div_id = os.path.splitext(os.path.basename(output_file))[0]
+        width = fig.layout.width or '100%'
+        height = fig.layout.height or '100%'
+        key = (include_plotlyjs, div_id, width, height, repr(config))
+
+        shell = self._html_shells.get(key)
+        if shell is None:
+            html = pio.to_html({'data': [], 'layout': {}}, config=config,
+                               include_plotlyjs=include_plotlyjs, validate=False,
+                               div_id=div_id, default_width=width, default_height=height)
+            # Plotly.newPlot("<div_id>", [], {}, <config>) - keep everything
+            # around the "[], {}" pair
+            data_start = html.index('[]', html.index(f'"{div_id}",'))
+            layout_end = html.index('{}', data_start + 2) + 2
+            shell = (html[:data_start], html[data_start + 2:layout_end - 2], html[layout_end:])
+            self._html_shells[key] = shell
+        return shell
+
+    def _write_html(self, fig, output_file, config):
+        """
+        Render fig to output_file as a standalone HTML page.
+
+        Only the figure JSON is serialized per call; the surrounding page
+        comes from _html_shell. The file is swapped in whole via
+        _atomic_write, and skipped when it would be identical to the last
+        one written. With gzip_output the same page is also written as
+        output_file + '.gz' for servers that send precompressed files with
+        Content-Encoding: gzip.
+        """
+        head, separator, tail = self._html_shell(fig, output_file, config)
+        fig_dict = fig.to_dict()
+        html = ''.join((head, pio.json.to_json_plotly(fig_dict['data']), separator,
+                        pio.json.to_json_plotly(fig_dict['layout']), tail)).encode('utf-8')
+
+        # Nothing changed since the last refresh - leave the file (and its
+        # mtime / browser and git caches) alone
+        digest = hashlib.blake2b(html, digest_size=16).digest()
+        if self._last_digest.get(output_file) == digest and os.path.exists(output_file):
+            return
+
+        self._atomic_write(output_file, html)
+
+        if self.gzip_output:
+            self._atomic_write(output_file + '.gz', gzip.compress(html, compresslevel=6))
+
+        # Only remember pages that actually reached disk, so a failed write
+        # is retried on the next identical render
+        self._last_digest[output_file] = digest
+
+    def _atomic_write(self, path, data):
+        """
+        Write bytes to path through a temporary file and os.replace, so a
+        browser or git picking the file up mid-refresh never sees half a page.
+        """
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _plotlyjs_bundle(self, output_file):
+        """
+        Make sure a versioned plotly.js bundle sits next to output_file.
+
+        Every dashboard written to the same directory references this one
+        file, so the browser caches a single local copy instead of going to
+        the CDN. The version in the name keeps a bundle written by an older
+        plotly from being picked up after an upgrade; older versioned bundles
+        written here are removed once the new one is written (other
+        plotly-*.min.js files, e.g. plotly-latest.min.js, are left alone).
+
+        Returns:
+            Bundle filename to pass as include_plotlyjs
+        """
+        bundle = f"plotly-{get_plotlyjs_version()}.min.js"
+        output_dir = os.path.dirname(os.path.abspath(output_file))
+        bundle_path = os.path.join(output_dir, bundle)
+        if not os.path.exists(bundle_path):
+            self._atomic_write(bundle_path, get_plotlyjs().encode('utf-8'))
+            # Drop bundles from older plotly versions so they do not pile up
+            # in the published directory
+            for name in os.listdir(output_dir):
+                if name != bundle and PLOTLYJS_BUNDLE_RE.fullmatch(name):
+                    os.remove(os.path.join(output_dir, name))
+        return bundle
+
+    def _same_times(self, a, b):
+        """Cheap check that two candle frames share the same timestamps."""
+        return (len(a) == len(b) and len(a) > 0
+                and a['datetime'].iloc[0] == b['datetime'].iloc[0]
+                and a['datetime'].iloc[-1] == b['datetime'].iloc[-1])
+
+    def _level_lines(self, support_levels, resistance_levels, bsl_ssl, x_range,
+                     xref='x domain', yref='y'):
+        """
+        Build S/R and BSL/SSL horizontal lines as line traces plus labels.
+
+        Levels of the same kind are drawn as one Scattergl trace whose
+        segments span x_range and are separated by NaN gaps, instead of one
+        layout shape per level.
+
+        Args:
+            support_levels: Support levels DataFrame
+            resistance_levels: Resistance levels DataFrame
+            bsl_ssl: Dict with BSL and SSL values
+            x_range: (start, end) x values the lines should span
+
+        Returns:
+            Tuple of (traces, annotations) lists
+        """
+        # group name -> (line color, line dash, label side)
+        groups = {
+            'Support': ('lime', 'solid', 'right'),
+            'Resistance': ('red', 'solid', 'right'),
+            'BSL': ('green', 'dash', 'left'),
+            'SSL': ('red', 'dash', 'left'),
+        }
+
+        # (price, label, group name)
+        levels = []
+        if support_levels is not None and len(support_levels) > 0:
+            levels += [(price, f"S{i+1}", 'Support')
+                       for i, price in enumerate(support_levels['price'].to_numpy())]
+        if resistance_levels is not None and len(resistance_levels) > 0:
+            levels += [(price, f"R{i+1}", 'Resistance')
+                       for i, price in enumerate(resistance_levels['price'].to_numpy())]
+        if bsl_ssl and 'bsl' in bsl_ssl and bsl_ssl['bsl'] is not None:
+            levels.append((bsl_ssl['bsl'], 'BSL', 'BSL'))
+        if bsl_ssl and 'ssl' in bsl_ssl and bsl_ssl['ssl'] is not None:
+            levels.append((bsl_ssl['ssl'], 'SSL', 'SSL'))
+
+        traces = []
+        for name, (color, dash, _) in groups.items():
+            prices = np.array([price for price, _, group in levels if group == name],
+                              dtype=np.float64)
+            if len(prices) == 0:
+                continue
+
+            # Each level is [start, end, gap]; the NaN y breaks the line
+            x = np.tile([x_range[0], x_range[1], x_range[1]], len(prices))
+            y = np.column_stack((prices, prices, np.full(len(prices), np.nan))).ravel()
+
+            traces.append(
+                go.Scattergl(
+                    x=x,
+                    y=y,
+                    mode='lines',
+                    name=name,
+                    line=dict(color=color, dash=dash, width=2),
+                    connectgaps=False,
+                    showlegend=False,
+                    hoverinfo='skip'
+                )
+            )
+
+        annotations = []
+        for price, label, group in levels:
+            side = groups[group][2]
+            annotations.append(
+                dict(text=label, xref=xref, yref=yref, y=price, showarrow=False,
+                     x=1 if side == 'right' else 0,
+                     xanchor='left' if side == 'right' else 'right',
+                     yanchor='middle')
+            )
+
+        return traces, annotations
 
     def create_altcoin_ratio_chart(self, btc_df, ratio_df, support_levels=None,
                                      resistance_levels=None, bsl_ssl=None,
@@ -31,14 +451,13 @@ class AltcoinRatioVisualizer:
         """
         fig = go.Figure()
 
+        arrays = self._chart_arrays(btc_df, ratio_df)
+
         # 1. BTC Candlesticks (background, muted colors)
         fig.add_trace(
             go.Candlestick(
-                x=btc_df['datetime'],
-                open=btc_df['open'],
-                high=btc_df['high'],
-                low=btc_df['low'],
-                close=btc_df['close'],
+                x=arrays['btc_times'],
+                **arrays['btc_ohlc'],
                 name='BTC/USDT',
                 increasing_line_color='rgba(150, 150, 150, 0.3)',
                 decreasing_line_color='rgba(100, 100, 100, 0.3)',
@@ -51,11 +470,8 @@ class AltcoinRatioVisualizer:
         # 2. Altcoin Ratio Candlesticks (yellow overlay)
         fig.add_trace(
             go.Candlestick(
-                x=ratio_df['datetime'],
-                open=ratio_df['ar_open'],
-                high=ratio_df['ar_high'],
-                low=ratio_df['ar_low'],
-                close=ratio_df['ar_close'],
+                x=arrays['candle_times'],
+                **arrays['ratio_ohlc'],
                 name='Alt Ratio [15M]',
                 increasing_line_color='rgba(255, 204, 0, 0.6)',
                 decreasing_line_color='rgba(255, 204, 0, 0.8)',
@@ -67,88 +483,48 @@ class AltcoinRatioVisualizer:
 
         # 3. SMA 50 (orange)
         fig.add_trace(
-            go.Scatter(
-                x=ratio_df['datetime'],
-                y=ratio_df['sma50'],
+            go.Scattergl(
+                **arrays['sma50'],
                 name='SMA 50',
                 line=dict(color='orange', width=2),
-                showlegend=True
+                showlegend=True,
+                hoverinfo='y+name'
             )
         )
 
         # 4. EMA 21 (blue)
         fig.add_trace(
-            go.Scatter(
-                x=ratio_df['datetime'],
-                y=ratio_df['ema21'],
+            go.Scattergl(
+                **arrays['ema21'],
                 name='EMA 21',
                 line=dict(color='blue', width=2),
                 showlegend=True,
-                fill=None
+                fill=None,
+                hoverinfo='y+name'
             )
         )
 
         # 5. SMA 20 (green) with fill to EMA 21
         fig.add_trace(
-            go.Scatter(
-                x=ratio_df['datetime'],
-                y=ratio_df['sma20'],
+            go.Scattergl(
+                **arrays['sma20'],
                 name='SMA 20',
                 line=dict(color='green', width=2),
                 fill='tonexty',
                 fillcolor='rgba(0, 255, 255, 0.15)',
-                showlegend=True
+                showlegend=True,
+                hoverinfo='y+name'
             )
         )
 
-        # 6. Support Levels (green lines)
-        if support_levels is not None and len(support_levels) > 0:
-            for idx, level in support_levels.iterrows():
-                fig.add_hline(
-                    y=level['price'],
-                    line_dash="solid",
-                    line_color="lime",
-                    line_width=2,
-                    annotation_text=f"S{idx+1}",
-                    annotation_position="right"
-                )
-
-        # 7. Resistance Levels (red lines)
-        if resistance_levels is not None and len(resistance_levels) > 0:
-            for idx, level in resistance_levels.iterrows():
-                fig.add_hline(
-                    y=level['price'],
-                    line_dash="solid",
-                    line_color="red",
-                    line_width=2,
-                    annotation_text=f"R{idx+1}",
-                    annotation_position="right"
-                )
-
-        # 8. BSL (Buy-Side Liquidity - green)
-        if bsl_ssl and 'bsl' in bsl_ssl and bsl_ssl['bsl'] is not None:
-            fig.add_hline(
-                y=bsl_ssl['bsl'],
-                line_dash="dash",
-                line_color="green",
-                line_width=2,
-                annotation_text="BSL",
-                annotation_position="left"
-            )
+        # 6-9. Support/Resistance (lime/red) and BSL/SSL (dashed) lines
+        level_traces, annotations = self._level_lines(
+            support_levels, resistance_levels, bsl_ssl, arrays['x_range'])
+        fig.add_traces(level_traces)
 
-        # 9. SSL (Sell-Side Liquidity - red)
-        if bsl_ssl and 'ssl' in bsl_ssl and bsl_ssl['ssl'] is not None:
-            fig.add_hline(
-                y=bsl_ssl['ssl'],
-                line_dash="dash",
-                line_color="red",
-                line_width=2,
-                annotation_text="SSL",
-                annotation_position="left"
-            )
-
-        # Update layout
+        # Update layout (level labels and axis titles in the same call)
         fig.update_layout(
+            annotations=list(fig.layout.annotations) + annotations,
             title=dict(
                 text='<b>Altcoin Ratio [15M] + BSL/SSL + Auto S/R</b>',
                 x=0.5,
@@ -156,11 +532,14 @@ class AltcoinRatioVisualizer:
                 font=dict(size=20)
             ),
             hovermode='x unified',
+            spikedistance=0,
             template='plotly_dark',
             width=2400,
             height=800,
             showlegend=True,
             xaxis_rangeslider_visible=False,
+            xaxis_title_text="Time",
+            yaxis_title_text="Price",
             legend=dict(
                 orientation="h",
                 yanchor="bottom",
@@ -170,9 +549,6 @@ class AltcoinRatioVisualizer:
             )
         )
 
-        fig.update_xaxes(title_text="Time")
-        fig.update_yaxes(title_text="Price")
-
         # Save HTML with interactive config
         config = {
             'displayModeBar': True,
@@ -186,7 +562,7 @@ class AltcoinRatioVisualizer:
                 'scale': 1
             }
         }
-        fig.write_html(output_file, config=config)
+        self._write_html(fig, output_file, config)
         print(f"\n✓ Altcoin Ratio chart saved to: {output_file}")
 
         return output_file
@@ -225,9 +601,9 @@ class AltcoinRatioVisualizer:
         aggressive_buys = footprint_df[footprint_df['is_aggressive_buy']]
         if len(aggressive_buys) > 0:
             fig.add_trace(
-                go.Scatter(
-                    x=aggressive_buys['datetime'],
-                    y=aggressive_buys['low'],
+                go.Scattergl(
+                    x=self._local_times(aggressive_buys['datetime']),
+                    y=aggressive_buys['low'].to_numpy(dtype=np.float32),
                     mode='markers',
                     name='Aggressive Buy',
                     marker=dict(
@@ -236,7 +612,7 @@ class AltcoinRatioVisualizer:
                         color='lime',
                         line=dict(color='darkgreen', width=1)
                     ),
-                    hovertemplate='<b>Aggressive Buy</b><br>Price: %{y:.2f}<extra></extra>'
+                    hovertemplate=AGGRESSIVE_BUY_HOVER
                 )
             )
 
@@ -244,9 +620,9 @@ class AltcoinRatioVisualizer:
         aggressive_sells = footprint_df[footprint_df['is_aggressive_sell']]
         if len(aggressive_sells) > 0:
             fig.add_trace(
-                go.Scatter(
-                    x=aggressive_sells['datetime'],
-                    y=aggressive_sells['high'],
+                go.Scattergl(
+                    x=self._local_times(aggressive_sells['datetime']),
+                    y=aggressive_sells['high'].to_numpy(dtype=np.float32),
                     mode='markers',
                     name='Aggressive Sell',
                     marker=dict(
@@ -255,31 +631,38 @@ class AltcoinRatioVisualizer:
                         color='red',
                         line=dict(color='darkred', width=1)
                     ),
-                    hovertemplate='<b>Aggressive Sell</b><br>Price: %{y:.2f}<extra></extra>'
+                    hovertemplate=AGGRESSIVE_SELL_HOVER
                 )
             )
 
         # Trap zones (yellow rectangles)
         traps = footprint_df[footprint_df['is_trap']]
-        for idx, trap in traps.iterrows():
-            fig.add_shape(
-                type="rect",
-                x0=trap['datetime'] - pd.Timedelta(minutes=7.5),
-                x1=trap['datetime'] + pd.Timedelta(minutes=7.5),
-                y0=trap['low'],
-                y1=trap['high'],
-                fillcolor='rgba(255, 255, 0, 0.3)',
-                line=dict(color='yellow', width=2)
-            )
-
-            # Warning label
-            fig.add_annotation(
-                x=trap['datetime'],
-                y=trap['high'],
-                text="⚠",
-                showarrow=False,
-                font=dict(size=16, color='yellow'),
-                bgcolor='rgba(0, 0, 0, 0.5)'
+        if len(traps) > 0:
+            half_width = pd.Timedelta(minutes=7.5)
+            trap_times = traps['datetime'].to_numpy()
+            x0s = (traps['datetime'] - half_width).to_numpy()
+            x1s = (traps['datetime'] + half_width).to_numpy()
+            lows = traps['low'].to_numpy()
+            highs = traps['high'].to_numpy()
+
+            shapes = [
+                dict(type='rect', x0=x0, x1=x1, y0=low, y1=high,
+                     fillcolor='rgba(255, 255, 0, 0.3)',
+                     line=dict(color='yellow', width=2))
+                for x0, x1, low, high in zip(x0s, x1s, lows, highs)
+            ]
+
+            # Warning labels
+            annotations = [
+                dict(x=x, y=high, text="⚠", showarrow=False,
+                     font=dict(size=16, color='yellow'),
+                     bgcolor='rgba(0, 0, 0, 0.5)')
+                for x, high in zip(trap_times, highs)
+            ]
+
+            fig.update_layout(
+                shapes=list(fig.layout.shapes) + shapes,
+                annotations=list(fig.layout.annotations) + annotations
             )
 
         return fig
@@ -289,51 +672,86 @@ class AltcoinRatioVisualizer:
         if profile_df is None or len(profile_df) == 0:
             return fig
 
-        max_vol = max(profile_df['buy_volume'].max(), profile_df['sell_volume'].max())
+        volumes = profile_df[['buy_volume', 'sell_volume']].to_numpy()
+        max_vol = volumes.max()
 
         if max_vol == 0:
             return fig
 
         time_offset = pd.Timedelta(minutes=offset * 15)  # 15m timeframe
+        sell_offset = time_offset + pd.Timedelta(minutes=(profile_scale + 2) * 15)
 
-        # Buy volume bars (green)
-        for idx, row in profile_df.iterrows():
-            if row['buy_volume'] > 0:
-                width = (row['buy_volume'] / max_vol) * profile_scale
-                bar_start = current_time + time_offset
-                bar_end = bar_start + pd.Timedelta(minutes=width * 15)
-
-                fig.add_shape(
-                    type="rect",
-                    x0=bar_start,
-                    x1=bar_end,
-                    y0=row['price_bottom'],
-                    y1=row['price_top'],
-                    fillcolor='rgba(0, 255, 187, 0.7)',
-                    line=dict(width=1, color='rgba(0, 255, 187, 0.7)')
-                )
+        buy_volumes = volumes[:, 0]
+        sell_volumes = volumes[:, 1]
+        price_tops = profile_df['price_top'].to_numpy()
+        price_bottoms = profile_df['price_bottom'].to_numpy()
 
-        # Sell volume bars (red, offset to the right)
-        sell_offset = time_offset + pd.Timedelta(minutes=(profile_scale + 2) * 15)
+        shapes = []
+        # Buy volume bars (green), then sell volume bars (red, offset to the right)
+        for side_volumes, bar_offset, color in ((buy_volumes, time_offset, 'rgba(0, 255, 187, 0.7)'),
+                                                (sell_volumes, sell_offset, 'rgba(255, 17, 0, 0.7)')):
+            mask = side_volumes > 0
+            widths = (side_volumes[mask] / max_vol) * profile_scale
+            bar_start = current_time + bar_offset
+            bar_ends = bar_start + pd.to_timedelta(widths * 15, unit='m')
 
-        for idx, row in profile_df.iterrows():
-            if row['sell_volume'] > 0:
-                width = (row['sell_volume'] / max_vol) * profile_scale
-                bar_start = current_time + sell_offset
-                bar_end = bar_start + pd.Timedelta(minutes=width * 15)
-
-                fig.add_shape(
-                    type="rect",
-                    x0=bar_start,
-                    x1=bar_end,
-                    y0=row['price_bottom'],
-                    y1=row['price_top'],
-                    fillcolor='rgba(255, 17, 0, 0.7)',
-                    line=dict(width=1, color='rgba(255, 17, 0, 0.7)')
-                )
+            shapes += [
+                dict(type='rect', x0=bar_start, x1=bar_end, y0=bottom, y1=top,
+                     fillcolor=color, line=dict(width=1, color=color))
+                for bar_end, bottom, top in zip(bar_ends, price_bottoms[mask], price_tops[mask])
+            ]
+
+        fig.update_layout(shapes=list(fig.layout.shapes) + shapes)
 
         return fig
 
+    def _depth_traces(self, orderbook_data):
+        """
+        Build cumulative bid/ask depth traces from an order book snapshot.
+
+        Both sides are Scattergl traces, so plotly.js draws them in the
+        subplot's shared WebGL context; they stay separate traces to keep
+        the green/red fills.
+
+        Args:
+            orderbook_data: Order book snapshot with bids and asks
+
+        Returns:
+            Tuple of ([bid_trace, ask_trace], bid_volume, ask_volume)
+        """
+        bids_arr = np.asarray(orderbook_data['bids'], dtype=np.float64).reshape(-1, 2)
+        asks_arr = np.asarray(orderbook_data['asks'], dtype=np.float64).reshape(-1, 2)
+
+        # Calculate cumulative volumes (accumulated in float64, plotted as float32)
+        bid_cumulative = np.cumsum(bids_arr[:, 1])
+        ask_cumulative = np.cumsum(asks_arr[:, 1])
+
+        # The last cumulative value is the side total; no second pass needed
+        bid_volume = bid_cumulative[-1] if len(bid_cumulative) else 0.0
+        ask_volume = ask_cumulative[-1] if len(ask_cumulative) else 0.0
+
+        traces = [
+            go.Scattergl(
+                x=bids_arr[:, 0].astype(np.float32),
+                y=bid_cumulative.astype(np.float32),
+                name='Bid Depth',
+                fill='tozeroy',
+                fillcolor='rgba(0, 255, 0, 0.3)',
+                line=dict(color='green', width=2),
+                hovertemplate=BID_HOVER
+            ),
+            go.Scattergl(
+                x=asks_arr[:, 0].astype(np.float32),
+                y=ask_cumulative.astype(np.float32),
+                name='Ask Depth',
+                fill='tozeroy',
+                fillcolor='rgba(255, 0, 0, 0.3)',
+                line=dict(color='red', width=2),
+                hovertemplate=ASK_HOVER
+            )
+        ]
+        return traces, bid_volume, ask_volume
+
     def create_orderbook_depth_chart(self, orderbook_data, output_file='orderbook_depth.html'):
         """
         Create real-time order book depth chart.
@@ -349,51 +767,12 @@ class AltcoinRatioVisualizer:
         bids = orderbook_data['bids']  # [[price, qty], ...]
         asks = orderbook_data['asks']
 
-        # Calculate cumulative volumes
-        bid_prices = [price for price, _ in bids]
-        bid_volumes = [qty for _, qty in bids]
-        bid_cumulative = []
-        cumsum = 0
-        for vol in bid_volumes:
-            cumsum += vol
-            bid_cumulative.append(cumsum)
-
-        ask_prices = [price for price, _ in asks]
-        ask_volumes = [qty for _, qty in asks]
-        ask_cumulative = []
-        cumsum = 0
-        for vol in ask_volumes:
-            cumsum += vol
-            ask_cumulative.append(cumsum)
-
         # Create figure
         fig = go.Figure()
 
-        # Bid side (green, left)
-        fig.add_trace(
-            go.Scatter(
-                x=bid_prices,
-                y=bid_cumulative,
-                name='Bid Depth',
-                fill='tozeroy',
-                fillcolor='rgba(0, 255, 0, 0.3)',
-                line=dict(color='green', width=2),
-                hovertemplate='<b>Bid</b><br>Price: $%{x:.2f}<br>Cumulative: %{y:.2f}<extra></extra>'
-            )
-        )
-
-        # Ask side (red, right)
-        fig.add_trace(
-            go.Scatter(
-                x=ask_prices,
-                y=ask_cumulative,
-                name='Ask Depth',
-                fill='tozeroy',
-                fillcolor='rgba(255, 0, 0, 0.3)',
-                line=dict(color='red', width=2),
-                hovertemplate='<b>Ask</b><br>Price: $%{x:.2f}<br>Cumulative: %{y:.2f}<extra></extra>'
-            )
-        )
+        # Bid side (green, left) and ask side (red, right)
+        depth_traces, bid_volume, ask_volume = self._depth_traces(orderbook_data)
+        fig.add_traces(depth_traces)
 
         # Mark best bid/ask
         if bids:
@@ -405,8 +784,6 @@ class AltcoinRatioVisualizer:
                          annotation_text="Best Ask", annotation_position="top")
 
         # Calculate stats for title
-        bid_volume = sum(qty for _, qty in bids)
-        ask_volume = sum(qty for _, qty in asks)
         imbalance = bid_volume / ask_volume if ask_volume > 0 else 0
         spread = asks[0][0] - bids[0][0] if asks and bids else 0
 
@@ -423,7 +800,8 @@ class AltcoinRatioVisualizer:
             template='plotly_dark',
             height=600,
             showlegend=True,
-            hovermode='x unified'
+            hovermode='x unified',
+            spikedistance=0
         )
 
         config = {
@@ -437,7 +815,7 @@ class AltcoinRatioVisualizer:
                 'scale': 1
             }
         }
-        fig.write_html(output_file, config=config)
+        self._write_html(fig, output_file, config)
         print(f"\n✓ Order book depth chart saved to: {output_file}")
 
         return output_file
@@ -455,14 +833,7 @@ class AltcoinRatioVisualizer:
             return fig
 
         # Create annotation with order book stats
-        stats_text = (
-            f"<b>Order Book (Live)</b><br>"
-            f"Spread: ${orderbook_stats['spread']:.2f} ({orderbook_stats['spread_pct']:.3f}%)<br>"
-            f"Bid Vol: {orderbook_stats['bid_volume']:.2f}<br>"
-            f"Ask Vol: {orderbook_stats['ask_volume']:.2f}<br>"
-            f"Ratio: {orderbook_stats['volume_ratio']:.2f}<br>"
-            f"<b>Imbalance: {orderbook_stats['imbalance']}</b>"
-        )
+        stats_text = ORDERBOOK_STATS_TEMPLATE.format(**orderbook_stats)
 
         y_pos = 0.02 if y_position == 'bottom' else 0.98
         y_anchor = 'bottom' if y_position == 'bottom' else 'top'
@@ -484,28 +855,44 @@ class AltcoinRatioVisualizer:
 
         return fig
 
-    def create_combined_chart(self, btc_df, ratio_df, orderbook_data,
-                               support_levels=None, resistance_levels=None,
-                               bsl_ssl=None, footprint_df=None,
-                               orderbook_candles=50,
-                               output_file='altcoin_combined.html'):
+    def _combined_base(self, btc_times, btc_ohlc, support_levels, resistance_levels,
+                       bsl_ssl, x_range):
         """
-        Create combined multi-panel chart:
-        - Top panel: Altcoin Ratio with all indicators
-        - Bottom panel: Real-time Order Book Depth
+        Return the slow-changing part of the combined chart.
+
+        The subplot grid and static layout (DASHBOARD_LAYOUT), BTC candles and
+        S/R / BSL/SSL lines live in one figure kept across refreshes, keyed on
+        the level prices only. While the levels stay the same, each refresh
+        swaps the candle arrays and the level lines' x endpoints in place; the
+        grid, layout and level lines are rebuilt only when the levels change.
+        Callers must copy it (go.Figure(base)) before adding traces.
 
         Args:
-            btc_df: BTC OHLCV data
-            ratio_df: Altcoin ratio data with indicators
-            orderbook_data: Current order book snapshot
+            btc_times: Wall-clock times of the (downsampled) BTC candles
+            btc_ohlc: BTC open/high/low/close arrays (_ohlc_arrays)
             support_levels: Support levels DataFrame
             resistance_levels: Resistance levels DataFrame
             bsl_ssl: Dict with BSL and SSL values
-            footprint_df: Footprint analysis data
-            orderbook_candles: Number of recent candles to show for order book reference
-            output_file: Output HTML filename
+            x_range: (start, end) x values the level lines should span
         """
-        from plotly.subplots import make_subplots
+        level_prices = tuple(
+            tuple(levels['price']) if levels is not None and len(levels) > 0 else ()
+            for levels in (support_levels, resistance_levels)
+        )
+        level_key = (
+            level_prices,
+            tuple(sorted(bsl_ssl.items())) if bsl_ssl else ()
+        )
+        cache = self._base_cache
+        if cache['fig'] is not None and cache['level_key'] == level_key:
+            # Same levels - swap the BTC candle arrays and the level lines'
+            # x endpoints (they follow the first/last candle) in place
+            fig = cache['fig']
+            with fig.batch_update():
+                fig.data[0].update(x=btc_times, **btc_ohlc)
+                for trace in fig.data[1:]:
+                    trace.x = np.tile([x_range[0], x_range[1], x_range[1]], len(trace.x) // 3)
+            return fig
 
         # Create subplots: 2 rows, 1 column
         # Top panel (70% height): Main chart
@@ -521,189 +908,145 @@ class AltcoinRatioVisualizer:
                    [{"secondary_y": False}]],
             shared_xaxes=False  # Order Book farkli x-axis (price) kullaniyor
         )
-
-        # ========== TOP PANEL: MAIN CHART ==========
+        # NATIVE ZOOM ALLOWED - only the title text changes per refresh
+        fig.update_layout(DASHBOARD_LAYOUT)
 
         # 1. BTC Candlesticks (background)
         fig.add_trace(
             go.Candlestick(
-                x=btc_df['datetime'],
-                open=btc_df['open'],
-                high=btc_df['high'],
-                low=btc_df['low'],
-                close=btc_df['close'],
+                x=btc_times,
+                **btc_ohlc,
                 name='BTC/USDT',
                 increasing_line_color='rgba(150, 150, 150, 0.3)',
                 decreasing_line_color='rgba(100, 100, 100, 0.3)',
                 increasing_fillcolor='rgba(150, 150, 150, 0.2)',
                 decreasing_fillcolor='rgba(100, 100, 100, 0.2)',
-                showlegend=True
+                showlegend=True,
+                hoverinfo='skip'  # unified tooltip: ratio mumu + SMA/EMA only
             ),
             row=1, col=1
         )
 
-        # 2. Altcoin Ratio Candlesticks
-        import numpy as np
+        # 6-9. Support/Resistance and BSL/SSL lines (top panel)
+        level_traces, annotations = self._level_lines(
+            support_levels, resistance_levels, bsl_ssl, x_range)
+        for trace in level_traces:
+            fig.add_trace(trace, row=1, col=1)
+        fig.update_layout(annotations=list(fig.layout.annotations) + annotations)
+
+        self._base_cache = {'level_key': level_key, 'fig': fig}
+        return fig
+
+    def create_combined_chart(self, btc_df, ratio_df, orderbook_data,
+                               support_levels=None, resistance_levels=None,
+                               bsl_ssl=None, footprint_df=None,
+                               orderbook_candles=50,
+                               output_file='altcoin_combined.html',
+                               view_days=None):
+        """
+        Create combined multi-panel chart:
+        - Top panel: Altcoin Ratio with all indicators
+        - Bottom panel: Real-time Order Book Depth
+
+        Args:
+            btc_df: BTC OHLCV data
+            ratio_df: Altcoin ratio data with indicators
+            orderbook_data: Current order book snapshot
+            support_levels: Support levels DataFrame
+            resistance_levels: Resistance levels DataFrame
+            bsl_ssl: Dict with BSL and SSL values
+            footprint_df: Footprint analysis data
+            orderbook_candles: Number of recent candles to show for order book reference
+            output_file: Output HTML filename
+            view_days: Only plot the last N days (None = every row). Indicators
+                are already computed, so older rows can still warm them up.
+        """
+        # ========== TOP PANEL: MAIN CHART ==========
 
+        if view_days is not None:
+            view_start = ratio_df['datetime'].iloc[-1] - pd.Timedelta(days=view_days)
+            btc_df = self._rows_from(btc_df, view_start)
+            ratio_df = self._rows_from(ratio_df, view_start)
+            # Footprint rows come newest-first, so they are masked, not searched
+            if footprint_df is not None and len(footprint_df) > 0:
+                footprint_df = footprint_df[footprint_df['datetime'] >= view_start]
+
+        arrays = self._chart_arrays(btc_df, ratio_df)
+
+        # 1 + 6-9. Grid, static layout, BTC candles and S/R levels come from the
+        # cached base figure; only the per-refresh traces below go on a copy of it
+        fig = go.Figure(self._combined_base(
+            arrays['btc_times'], arrays['btc_ohlc'], support_levels, resistance_levels,
+            bsl_ssl, arrays['x_range']))
+
+        # 2. Altcoin Ratio Candlesticks
         fig.add_trace(
             go.Candlestick(
-                x=ratio_df['datetime'],
-                open=ratio_df['ar_open'],
-                high=ratio_df['ar_high'],
-                low=ratio_df['ar_low'],
-                close=ratio_df['ar_close'],
+                x=arrays['candle_times'],
+                **arrays['ratio_ohlc'],
                 name='Alt Ratio [15M]',
                 increasing_line_color='rgba(255, 204, 0, 0.6)',
                 decreasing_line_color='rgba(255, 204, 0, 0.8)',
                 increasing_fillcolor='rgba(255, 204, 0, 0.4)',
                 decreasing_fillcolor='rgba(255, 204, 0, 0.6)',
-                showlegend=True,
-                hoverinfo='skip'  # Hover'ı kapat, aşağıdaki scatter gösterecek
-            ),
-            row=1, col=1
-        )
-
-        # 2b. Invisible Scatter for detailed hover info
-        hover_data = np.column_stack((
-            ratio_df['sma20'].fillna(0),
-            ratio_df['ema21'].fillna(0),
-            ratio_df['sma50'].fillna(0),
-            ratio_df['ar_open'],
-            ratio_df['ar_high'],
-            ratio_df['ar_low'],
-            ratio_df['ar_close']
-        ))
-
-        fig.add_trace(
-            go.Scatter(
-                x=ratio_df['datetime'],
-                y=ratio_df['ar_close'],
-                mode='markers',
-                marker=dict(size=0.1, opacity=0),  # Invisible
-                name='',
-                showlegend=False,
-                customdata=hover_data,
-                hovertemplate='<b>%{x}</b><br><br>' +
-                              '<b>SMA 20</b><br>%{customdata[0]:,.3f}<br><br>' +
-                              '<b>EMA 21</b><br>%{customdata[1]:,.3f}<br><br>' +
-                              '<b>SMA 50</b><br>%{customdata[2]:,.3f}<br><br>' +
-                              '<b>Alt Ratio [15M]</b><br>' +
-                              'Open: %{customdata[3]:,.2f}<br>' +
-                              'High: %{customdata[4]:,.2f}<br>' +
-                              'Low: %{customdata[5]:,.2f}<br>' +
-                              'Close: %{customdata[6]:,.2f}<br><br>' +
-                              '<b>Indicators:</b><br>' +
-                              'SMA 20: %{customdata[0]:,.3f}<br>' +
-                              'EMA 21: %{customdata[1]:,.3f}<br>' +
-                              'SMA 50: %{customdata[2]:,.3f}' +
-                              '<extra></extra>'
+                showlegend=True
             ),
             row=1, col=1
         )
 
         # 3. SMA 50 (orange)
         fig.add_trace(
-            go.Scatter(
-                x=ratio_df['datetime'],
-                y=ratio_df['sma50'],
+            go.Scattergl(
+                **arrays['sma50'],
                 name='SMA 50',
                 line=dict(color='orange', width=2),
-                showlegend=True
+                showlegend=True,
+                hovertemplate='<b>SMA 50</b> %{y:,.3f}<extra></extra>'
             ),
             row=1, col=1
         )
 
         # 4. EMA 21 (blue)
         fig.add_trace(
-            go.Scatter(
-                x=ratio_df['datetime'],
-                y=ratio_df['ema21'],
+            go.Scattergl(
+                **arrays['ema21'],
                 name='EMA 21',
                 line=dict(color='blue', width=2),
                 showlegend=True,
-                fill=None
+                fill=None,
+                hovertemplate='<b>EMA 21</b> %{y:,.3f}<extra></extra>'
             ),
             row=1, col=1
         )
 
         # 5. SMA 20 (green) with fill
         fig.add_trace(
-            go.Scatter(
-                x=ratio_df['datetime'],
-                y=ratio_df['sma20'],
+            go.Scattergl(
+                **arrays['sma20'],
                 name='SMA 20',
                 line=dict(color='green', width=2),
                 fill='tonexty',
                 fillcolor='rgba(0, 255, 255, 0.15)',
-                showlegend=True
+                showlegend=True,
+                hovertemplate='<b>SMA 20</b> %{y:,.3f}<extra></extra>'
             ),
             row=1, col=1
         )
 
-        # 6. Support Levels
-        if support_levels is not None and len(support_levels) > 0:
-            for idx, level in support_levels.iterrows():
-                fig.add_hline(
-                    y=level['price'],
-                    line_dash="solid",
-                    line_color="lime",
-                    line_width=2,
-                    annotation_text=f"S{idx+1}",
-                    annotation_position="right",
-                    row=1, col=1
-                )
-
-        # 7. Resistance Levels
-        if resistance_levels is not None and len(resistance_levels) > 0:
-            for idx, level in resistance_levels.iterrows():
-                fig.add_hline(
-                    y=level['price'],
-                    line_dash="solid",
-                    line_color="red",
-                    line_width=2,
-                    annotation_text=f"R{idx+1}",
-                    annotation_position="right",
-                    row=1, col=1
-                )
-
-        # 8. BSL (Buy-Side Liquidity)
-        if bsl_ssl and 'bsl' in bsl_ssl and bsl_ssl['bsl'] is not None:
-            fig.add_hline(
-                y=bsl_ssl['bsl'],
-                line_dash="dash",
-                line_color="green",
-                line_width=2,
-                annotation_text="BSL",
-                annotation_position="left",
-                row=1, col=1
-            )
-
-        # 9. SSL (Sell-Side Liquidity)
-        if bsl_ssl and 'ssl' in bsl_ssl and bsl_ssl['ssl'] is not None:
-            fig.add_hline(
-                y=bsl_ssl['ssl'],
-                line_dash="dash",
-                line_color="red",
-                line_width=2,
-                annotation_text="SSL",
-                annotation_position="left",
-                row=1, col=1
-            )
-
         # 10. Footprint markers
         if footprint_df is not None and len(footprint_df) > 0:
             # Aggressive buyers
             aggressive_buys = footprint_df[footprint_df['is_aggressive_buy']]
             if len(aggressive_buys) > 0:
                 fig.add_trace(
-                    go.Scatter(
-                        x=aggressive_buys['datetime'],
-                        y=aggressive_buys['low'],
+                    go.Scattergl(
+                        x=self._local_times(aggressive_buys['datetime']),
+                        y=aggressive_buys['low'].to_numpy(dtype=np.float32),
                         mode='markers',
                         name='Aggressive Buy',
                         marker=dict(symbol='circle', size=8, color='lime',
                                    line=dict(color='darkgreen', width=1)),
-                        hovertemplate='<b>Aggressive Buy</b><br>Price: %{y:.2f}<extra></extra>'
+                        hovertemplate=AGGRESSIVE_BUY_HOVER
                     ),
                     row=1, col=1
                 )
@@ -712,14 +1055,14 @@ class AltcoinRatioVisualizer:
             aggressive_sells = footprint_df[footprint_df['is_aggressive_sell']]
             if len(aggressive_sells) > 0:
                 fig.add_trace(
-                    go.Scatter(
-                        x=aggressive_sells['datetime'],
-                        y=aggressive_sells['high'],
+                    go.Scattergl(
+                        x=self._local_times(aggressive_sells['datetime']),
+                        y=aggressive_sells['high'].to_numpy(dtype=np.float32),
                         mode='markers',
                         name='Aggressive Sell',
                         marker=dict(symbol='circle', size=8, color='red',
                                    line=dict(color='darkred', width=1)),
-                        hovertemplate='<b>Aggressive Sell</b><br>Price: %{y:.2f}<extra></extra>'
+                        hovertemplate=AGGRESSIVE_SELL_HOVER
                     ),
                     row=1, col=1
                 )
@@ -730,50 +1073,10 @@ class AltcoinRatioVisualizer:
             bids = orderbook_data['bids']
             asks = orderbook_data['asks']
 
-            # Calculate cumulative volumes
-            bid_prices = [price for price, _ in bids]
-            bid_volumes = [qty for _, qty in bids]
-            bid_cumulative = []
-            cumsum = 0
-            for vol in bid_volumes:
-                cumsum += vol
-                bid_cumulative.append(cumsum)
-
-            ask_prices = [price for price, _ in asks]
-            ask_volumes = [qty for _, qty in asks]
-            ask_cumulative = []
-            cumsum = 0
-            for vol in ask_volumes:
-                cumsum += vol
-                ask_cumulative.append(cumsum)
-
-            # Bid side (green area)
-            fig.add_trace(
-                go.Scatter(
-                    x=bid_prices,
-                    y=bid_cumulative,
-                    name='Bid Depth',
-                    fill='tozeroy',
-                    fillcolor='rgba(0, 255, 0, 0.3)',
-                    line=dict(color='green', width=2),
-                    hovertemplate='<b>Bid</b><br>Price: $%{x:.2f}<br>Cumulative: %{y:.2f}<extra></extra>'
-                ),
-                row=2, col=1
-            )
-
-            # Ask side (red area)
-            fig.add_trace(
-                go.Scatter(
-                    x=ask_prices,
-                    y=ask_cumulative,
-                    name='Ask Depth',
-                    fill='tozeroy',
-                    fillcolor='rgba(255, 0, 0, 0.3)',
-                    line=dict(color='red', width=2),
-                    hovertemplate='<b>Ask</b><br>Price: $%{x:.2f}<br>Cumulative: %{y:.2f}<extra></extra>'
-                ),
-                row=2, col=1
-            )
+            # Bid side (green area) and ask side (red area)
+            depth_traces, bid_volume, ask_volume = self._depth_traces(orderbook_data)
+            for trace in depth_traces:
+                fig.add_trace(trace, row=2, col=1)
 
             # Mark best bid/ask
             if bids:
@@ -787,8 +1090,6 @@ class AltcoinRatioVisualizer:
                              row=2, col=1)
 
             # Calculate stats
-            bid_volume = sum(qty for _, qty in bids)
-            ask_volume = sum(qty for _, qty in asks)
             imbalance = bid_volume / ask_volume if ask_volume > 0 else 0
             spread = asks[0][0] - bids[0][0] if asks and bids else 0
 
@@ -815,84 +1116,16 @@ class AltcoinRatioVisualizer:
             )
 
         # Add timestamp to title
-        from datetime import datetime
-        import pytz
         dubai_tz = pytz.timezone('Asia/Dubai')
         current_time = datetime.now(dubai_tz).strftime('%H:%M:%S')
 
-        # Update layout - NATIVE ZOOM ALLOWED
+        # Static layout comes with the base figure; only the title changes
         fig.update_layout(
-            title=dict(
-                text=f'<b>Altcoin Terminal</b><br><sub style="color:#888">Last Update: Dubai {current_time}</sub>',
-                x=0.5,
-                xanchor='center',
-                font=dict(size=16)
-            ),
-            hovermode='closest',
-            template='plotly_dark',
-            autosize=True,
-            height=None,
-            showlegend=True,
-            dragmode=False,  # Plotly drag KAPALI - native kullan
-            xaxis_rangeslider_visible=False,
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.01,
-                xanchor="center",
-                x=0.5,
-                font=dict(size=9)
-            ),
-            margin=dict(l=30, r=10, t=60, b=30),
-            font=dict(size=10),
-            hoverlabel=dict(font_size=10)
-        )
-
-        # Update axes
-        fig.update_xaxes(
-            title_text="Time",
-            row=1, col=1,
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='rgba(128, 128, 128, 0.2)'
-        )
-        fig.update_yaxes(
-            title_text="Price",
-            row=1, col=1,
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='rgba(128, 128, 128, 0.2)'
+            title_text=f'<b>Altcoin Terminal</b><br><sub style="color:#888">Last Update: Dubai {current_time}</sub>'
         )
-        fig.update_xaxes(
-            title_text="Price (USD)",
-            row=2, col=1,
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='rgba(128, 128, 128, 0.2)'
-        )
-        fig.update_yaxes(
-            title_text="Cumulative Volume",
-            row=2, col=1,
-            showgrid=True,
-            gridwidth=1,
-            gridcolor='rgba(128, 128, 128, 0.2)'
-        )
-
-        # INTERACTIVE CHART - Zoom ve pan aktif
-        config = {
-            'displayModeBar': True,
-            'displaylogo': False,
-            'scrollZoom': True,  # Mouse wheel zoom AÇIK
-            'doubleClick': 'reset',  # Çift tık sıfırlar
-            'responsive': True,
-            'staticPlot': False,
-            'editable': False,
-            'showTips': True,
-            'modeBarButtonsToAdd': ['pan2d', 'zoom2d', 'zoomIn2d', 'zoomOut2d', 'resetScale2d'],
-        }
 
         # Direkt Plotly HTML - wrapper yok, tam interaktif
-        fig.write_html(output_file, config=config, include_plotlyjs='cdn')
+        self._write_html(fig, output_file, DASHBOARD_CONFIG)
 
         print(f"\n✓ Combined dashboard saved to: {output_file}")
 
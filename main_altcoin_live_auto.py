@@ -6,6 +6,7 @@ import sys
 import time
 from datetime import datetime
 import pytz
+from plotly.offline import get_plotlyjs_version
 from altcoin_ratio import AltcoinRatioCalculator
 from altcoin_visualizer import AltcoinRatioVisualizer
 from liquidity_levels import LiquidityAnalyzer
@@ -176,6 +177,10 @@ def main():
                 # HTML dosyasını yedekle
                 backup_file = "/tmp/altcoin_backup.html"
                 shutil.copy(html_file, backup_file)
+                # HTML'in kullandigi plotly.js bundle'i da yedekle (pull silebilir)
+                bundle_name = f"plotly-{get_plotlyjs_version()}.min.js"
+                bundle_backup = f"/tmp/{bundle_name}"
+                shutil.copy(f"{git_repo}/{bundle_name}", bundle_backup)
 
                 # Git durumunu temizle
                 subprocess.run(f"cd {git_repo} && rm -rf .git/rebase-merge 2>/dev/null", shell=True, check=False)
@@ -184,9 +189,10 @@ def main():
 
                 # HTML'i geri koy
                 shutil.copy(backup_file, html_file)
+                shutil.copy(bundle_backup, f"{git_repo}/{bundle_name}")
 
                 # Commit ve push
-                subprocess.run(f"cd {git_repo} && git add altcoin_combined_eth_live.html risk_metrics.json *_risk_analyzer.html", shell=True, check=True)
+                subprocess.run(f"cd {git_repo} && git add altcoin_combined_eth_live.html risk_metrics.json *_risk_analyzer.html && git add -A -- 'plotly-*.min.js'", shell=True, check=True)
                 commit_msg = f"Auto-update dashboard - Dubai {dubai_time_now}"
                 result = subprocess.run(f'cd {git_repo} && git commit -m "{commit_msg}"', shell=True, capture_output=True)
                 if result.returncode == 0: